@@ -29,14 +29,12 @@ class StderrWriter:
 try:
     sys.stdout = StderrWriter()
     
-    from movie.gemini_analyzer import MovieAnalyzer
-    import pandas as pd
+    from movie.gemini_analyzer import MovieAnalyzer, find_movie_by_title
     
-    df = pd.read_csv('tmdb_movies_since_1971.csv')
     title = "${title.replace(/"/g, '\\"')}"
-    movie_row = df[df['title'].str.lower() == title.lower()]
+    movie = find_movie_by_title(title)
     
-    if movie_row.empty:
+    if movie is None:
         movie = {
             "title": title,
             "overview": "",
@@ -46,14 +44,6 @@ try:
             "id": None,
             "imdb_id": None
         }
-    else:
-        movie = movie_row.iloc[0].to_dict()
-        import numpy as np
-        for key, value in movie.items():
-            if hasattr(value, 'item'):
-                movie[key] = value.item()
-            elif pd.isna(value):
-                movie[key] = None
     
     analyzer = MovieAnalyzer()
     analysis = analyzer.analyze_movie_intensity(movie)
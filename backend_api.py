@@ -4,47 +4,61 @@ This file was part of the project before line-count simplification attempts.
 It provides complete dataset loading, merging, simple filtering, and a small sample interaction generator.
 """
 
+import csv
 import os
 import time
 import re
-import pickle
-from typing import List, Dict, Any
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Dict, Any, Optional
 
 import pandas as pd
 import numpy as np
 
+# PyArrow's multithreaded CSV reader is used for the large TMDB dump when available
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+    feather = None
 
-def safe_float(v, default: float = 0.0) -> float:
-    try:
-        x = float(v)
-        return default if pd.isna(x) or x != x else x
-    except Exception:
-        return default
 
+ROMAN_MAP = {'ii': '2', 'iii': '3', 'iv': '4', 'v': '5', 'vi': '6', 'vii': '7', 'viii': '8', 'ix': '9', 'x': '10'}
+# compiled once at import; their .pattern strings are what pandas' str.replace receives,
+# so the column-wide replace stays in the Arrow regex kernel instead of a per-row callable
+NON_ALNUM_RE = re.compile(r'[^a-z0-9 ]')
+ROMAN_RES = [(re.compile(r'\b' + numeral + r'\b'), digit) for numeral, digit in ROMAN_MAP.items()]
+WS_RE = re.compile(r'\s+')
 
-def safe_int(v, default: int = 0) -> int:
-    try:
-        return int(float(v))
-    except Exception:
-        return default
+SUPPORTED_LANGUAGES = ['en', 'hi']
 
+TMDB_COLUMNS = ['id', 'title', 'vote_average', 'vote_count', 'release_date', 'original_language',
+                'genres', 'overview', 'poster_path', 'imdb_id']
 
-def parse_votes(v):
-    try:
-        return int(str(v).replace(',', ''))
-    except Exception:
-        return 0
 
+def parse_votes(s: pd.Series) -> pd.Series:
+    """Parse vote counts like '1,234' in one vectorized pass; unparseable values become 0."""
+    return pd.to_numeric(s.astype(str).str.replace(',', '', regex=False), errors='coerce').fillna(0).astype(np.int32)
 
-def map_language(lang):
-    if pd.isna(lang):
-        return 'unknown'
-    s = str(lang).lower()
-    if 'hindi' in s or 'bollywood' in s:
-        return 'hi'
-    if 'english' in s:
-        return 'en'
-    return 'unknown'
+
+def map_language(s: pd.Series) -> pd.Series:
+    """Map free-text language labels to 'hi' / 'en' / 'unknown'."""
+    lower = s.astype('string').str.lower()
+    conditions = [
+        lower.str.contains('hindi|bollywood', na=False).to_numpy(dtype=bool),
+        lower.str.contains('english', na=False).to_numpy(dtype=bool),
+    ]
+    return pd.Series(np.select(conditions, ['hi', 'en'], default='unknown'), index=s.index)
+
+
+def as_text(v, default: str = '') -> str:
+    return default if v is None or pd.isna(v) else str(v)
 
 
 class MovieRecommendationAPI:
@@ -54,32 +68,49 @@ class MovieRecommendationAPI:
         self.movies_df = pd.DataFrame()
         self.interactions_df = pd.DataFrame()
         self.is_loaded = False
-        self.cache_file = 'data/processed_movies_cache.pkl'
+        self.indian_path = 'data/indian movies.csv'
+        self.imdb_path = 'data/imdb_top_1000.csv'
+        self.cache_dir = 'data/processed_movies_cache'
         self.load_data()
 
     def load_data(self):
+        # drop indexes derived from a previous movies_df; they rebuild on first query
+        for name in ('ranked_positions', 'lang_index', 'genre_masks'):
+            self.__dict__.pop(name, None)
         if self.load_from_cache():
             return
-        tmdb = self.load_tmdb_data()
-        indian = self.load_indian_movies_data()
-        imdb = self.load_imdb_top1000_data()
+        # the three sources are disjoint files; CSV parsing releases the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            futures = [ex.submit(fn) for fn in (self.load_tmdb_data, self.load_indian_movies_data, self.load_imdb_top1000_data)]
+            tmdb, indian, imdb = [f.result() for f in futures]
         self.movies_df = self.combine_datasets(tmdb, indian, imdb)
 
         if not self.movies_df.empty:
-            self.movies_df['vote_average'] = pd.to_numeric(self.movies_df.get('vote_average', 0), errors='coerce').fillna(0.0)
-            self.movies_df['vote_count'] = pd.to_numeric(self.movies_df.get('vote_count', 0), errors='coerce').fillna(0).astype(int)
+            # combine_datasets already returns float vote_average / int vote_count; only the
+            # year is re-derived, since TMDB rows carry a release_date but no release_year
             if 'release_date' in self.movies_df.columns:
                 self.movies_df['release_year'] = pd.to_datetime(self.movies_df['release_date'], errors='coerce').dt.year.fillna(0).astype(int)
 
-        if not self.movies_df.empty:
-            self.movies_df = self.movies_df[
-                (self.movies_df['vote_average'] >= 6.0) &
-                (self.movies_df['vote_count'] >= 2000) &
-                (self.movies_df.get('release_year', 0) >= 1970)
-            ]
+            # TMDB rows were pre-filtered in the Arrow reader, but the other sources and the
+            # merged vote averages only exist here, so this single pass stays canonical
+            # eval() fuses the three comparisons into one numexpr loop when numexpr is installed
+            mask = self.movies_df.eval('vote_average >= 6.0 and vote_count >= 2000 and release_year >= 1970')
             if 'original_language' in self.movies_df.columns:
-                self.movies_df = self.movies_df[self.movies_df['original_language'].isin(['en', 'hi'])]
-
+                mask &= self.movies_df['original_language'].isin(SUPPORTED_LANGUAGES)
+            self.movies_df = self.movies_df[mask]
+
+        # low-cardinality string columns: int8 codes instead of Python objects
+        for col in ('original_language', 'source'):
+            if col in self.movies_df.columns:
+                self.movies_df[col] = self.movies_df[col].astype('category')
+        # Arrow-backed text columns: .str methods dispatch to PyArrow's C++ kernels, and
+        # this is the same dtype the Feather cache hands back
+        if pa is not None:
+            for col in ('title', 'genres', 'overview'):
+                if col in self.movies_df.columns:
+                    self.movies_df[col] = self.movies_df[col].astype('string').astype(pd.ArrowDtype(pa.string()))
+
+        self.add_title_norm()
         self.create_sample_interactions()
         self.save_to_cache()
         self.is_loaded = True
@@ -87,22 +118,45 @@ class MovieRecommendationAPI:
     def load_tmdb_data(self):
         if not os.path.exists(self.data_path):
             return pd.DataFrame()
-        chunks = []
-        for chunk in pd.read_csv(self.data_path, chunksize=100000):
-            if 'vote_average' in chunk.columns and 'vote_count' in chunk.columns:
-                chunk = chunk[(pd.to_numeric(chunk['vote_average'], errors='coerce').fillna(0) >= 6.0) &
-                              (pd.to_numeric(chunk['vote_count'], errors='coerce').fillna(0).astype(int) >= 2000)]
-            chunks.append(chunk)
-        if not chunks:
-            return pd.DataFrame()
-        df = pd.concat(chunks, ignore_index=True, sort=False)
+        if pacsv is not None:
+            # only the columns the file actually has, so a missing vote column skips the filter as before
+            with open(self.data_path, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            columns = [c for c in TMDB_COLUMNS if c in header]
+            tbl = pacsv.read_csv(
+                self.data_path,
+                read_options=pacsv.ReadOptions(block_size=1 << 24),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=columns,
+                    column_types={c: pa.string() for c in ('release_date', 'imdb_id') if c in columns},
+                    # empty fields load as null (NaN), like pd.read_csv
+                    strings_can_be_null=True,
+                ),
+            )
+            # filter before to_pandas() so discarded rows never become pandas objects. Only the vote
+            # thresholds are pushed down: language is filtered after combine_datasets, because a
+            # TMDB row in another language still decides its merged group's language and votes
+            if 'vote_average' in columns and 'vote_count' in columns:
+                tbl = tbl.filter(pc.and_(pc.greater_equal(tbl['vote_average'], 6.0),
+                                         pc.greater_equal(tbl['vote_count'], 2000)))
+            df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            chunks = []
+            for chunk in pd.read_csv(self.data_path, chunksize=100000):
+                if 'vote_average' in chunk.columns and 'vote_count' in chunk.columns:
+                    chunk = chunk[(pd.to_numeric(chunk['vote_average'], errors='coerce').fillna(0) >= 6.0) &
+                                  (pd.to_numeric(chunk['vote_count'], errors='coerce').fillna(0).astype(int) >= 2000)]
+                chunks.append(chunk)
+            if not chunks:
+                return pd.DataFrame()
+            df = pd.concat(chunks, ignore_index=True, sort=False)
         if 'imdb_id' not in df.columns:
             df['imdb_id'] = ''
         df['source'] = 'tmdb'
         return df
 
     def load_indian_movies_data(self):
-        path = 'data/indian movies.csv'
+        path = self.indian_path
         if not os.path.exists(path):
             return pd.DataFrame()
         df = pd.read_csv(path)
@@ -111,10 +165,10 @@ class MovieRecommendationAPI:
         out['title'] = df.get('Movie Name', '')
         out['imdb_id'] = df.get('ID', '')
         out['vote_average'] = pd.to_numeric(df.get('Rating(10)', 0).replace('-', np.nan), errors='coerce').fillna(0.0)
-        out['vote_count'] = df.get('Votes', '').apply(parse_votes)
+        out['vote_count'] = parse_votes(df.get('Votes', pd.Series('', index=df.index)))
         out['release_year'] = pd.to_numeric(df.get('Year', 2000), errors='coerce').fillna(2000).astype(int)
         out['release_date'] = out['release_year'].astype(str) + '-01-01'
-        out['original_language'] = df.get('Language', '').apply(map_language)
+        out['original_language'] = map_language(df.get('Language', pd.Series('', index=df.index)))
         out['genres'] = df.get('Genre', '').fillna('Unknown')
         out['overview'] = ''
         out['poster_path'] = ''
@@ -122,7 +176,7 @@ class MovieRecommendationAPI:
         return out
 
     def load_imdb_top1000_data(self):
-        path = 'data/imdb_top_1000.csv'
+        path = self.imdb_path
         if not os.path.exists(path):
             return pd.DataFrame()
         df = pd.read_csv(path)
@@ -131,7 +185,7 @@ class MovieRecommendationAPI:
         out['title'] = df.get('Series_Title', '')
         out['imdb_id'] = ''
         out['vote_average'] = pd.to_numeric(df.get('IMDB_Rating', 0), errors='coerce').fillna(0.0)
-        out['vote_count'] = df.get('No_of_Votes', '').apply(parse_votes)
+        out['vote_count'] = parse_votes(df.get('No_of_Votes', pd.Series('', index=df.index)))
         out['release_year'] = pd.to_numeric(df.get('Released_Year', 2000), errors='coerce').fillna(2000).astype(int)
         out['release_date'] = out['release_year'].astype(str) + '-01-01'
         out['original_language'] = 'en'
@@ -147,15 +201,11 @@ class MovieRecommendationAPI:
             return pd.DataFrame()
         combined = pd.concat(parts, ignore_index=True, sort=False)
 
-        roman_map = {'ii':'2','iii':'3','iv':'4','v':'5','vi':'6','vii':'7','viii':'8','ix':'9','x':'10'}
-
-        def normalize_title(s):
-            s = str(s or '').lower()
-            s = re.sub(r'[^a-z0-9 ]', ' ', s)
-            s = re.sub(r'\b(' + '|'.join(roman_map.keys()) + r')\b', lambda m: roman_map[m.group(1)], s)
-            return re.sub(r'\s+', ' ', s).strip()
-
-        combined['norm_title'] = combined.get('title', '').apply(normalize_title)
+        norm = combined.get('title', pd.Series('', index=combined.index)).fillna('').astype('string').str.lower()
+        norm = norm.str.replace(NON_ALNUM_RE.pattern, ' ', regex=True)
+        for roman_re, digit in ROMAN_RES:
+            norm = norm.str.replace(roman_re.pattern, digit, regex=True)
+        combined['norm_title'] = norm.str.replace(WS_RE.pattern, ' ', regex=True).str.strip()
         combined['imdb_id'] = combined.get('imdb_id', '').fillna('').astype(str).str.strip()
         combined['group_key'] = combined['imdb_id'].mask(combined.get('imdb_id', '') == '', combined['norm_title'])
 
@@ -163,41 +213,121 @@ class MovieRecommendationAPI:
         combined['vote_count'] = pd.to_numeric(combined.get('vote_count', 0), errors='coerce').fillna(0).astype(int)
         combined['release_year'] = pd.to_numeric(combined.get('release_year', 0), errors='coerce').fillna(0).astype(int)
 
-        agg_map = {
-            'vote_average': 'mean',
-            'vote_count': 'sum',
-            'id': 'first',
-            'title': 'first',
-            'imdb_id': 'first',
-            'poster_path': 'first',
-            'overview': 'first',
-            'genres': 'first',
-            'original_language': 'first',
-            'release_date': 'first',
-            'source': lambda s: ','.join(sorted(set(s.dropna())))
-        }
-        grouped = combined.groupby(['group_key', 'release_year'], sort=False).agg(agg_map).reset_index(drop=True)
+        # factorize the (group_key, release_year) pair into dense group ids in
+        # first-appearance order (same order groupby(sort=False) used) and
+        # aggregate with bincount instead of a multi-column hash groupby
+        key_codes, _ = pd.factorize(combined['group_key'])
+        years = combined['release_year'].to_numpy(dtype=np.int64)
+        span = int(years.max() - years.min()) + 1
+        composite = np.where(key_codes >= 0, key_codes.astype(np.int64) * span + (years - years.min()), -1)
+        combined = combined.loc[composite >= 0]
+        inv, _ = pd.factorize(composite[composite >= 0])
+        n_groups = int(inv.max()) + 1 if inv.size else 0
+
+        counts = np.bincount(inv, minlength=n_groups)
+        grouped = pd.DataFrame({
+            'vote_average': np.bincount(inv, weights=combined['vote_average'].to_numpy(dtype=float), minlength=n_groups) / counts,
+            'vote_count': np.bincount(inv, weights=combined['vote_count'].to_numpy(dtype=float), minlength=n_groups),
+        })
+
+        # 'first' keeps the first non-null value per group, like groupby().first()
+        for col in ['id', 'title', 'imdb_id', 'poster_path', 'overview', 'genres', 'original_language', 'release_date']:
+            rows = np.flatnonzero(combined[col].notna().to_numpy())
+            groups, first = np.unique(inv[rows], return_index=True)
+            first_idx = np.full(n_groups, -1, dtype=np.int64)
+            first_idx[groups] = rows[first]
+            values = combined[col].iloc[first_idx.clip(0)].reset_index(drop=True)
+            grouped[col] = values.mask(first_idx < 0)
+
+        # there are only a handful of sources, so encode each as a bit, OR them
+        # per group and decode via a lookup table
+        codes, names = pd.factorize(combined['source'], sort=True)
+        src_mask = np.zeros(n_groups, dtype=np.int64)
+        for bit in range(len(names)):
+            present = np.zeros(n_groups, dtype=bool)
+            present[inv[codes == bit]] = True
+            src_mask |= present.astype(np.int64) << bit
+        table = np.array([','.join(n for i, n in enumerate(names) if c >> i & 1) for c in range(1 << len(names))], dtype=object)
+        grouped['source'] = table[src_mask]
+
         grouped['vote_average'] = grouped['vote_average'].astype(float)
         grouped['vote_count'] = grouped['vote_count'].astype(int)
         return grouped
 
+    def add_title_norm(self):
+        if self.movies_df.empty:
+            return
+        self.movies_df['title_norm'] = self.movies_df['title'].fillna('').astype('string').str.strip().str.lower()
+
+    @cached_property
+    def ranked_positions(self) -> np.ndarray:
+        """Row positions ordered by (vote_average desc, vote_count desc), keeping vote_average >= 6."""
+        df = self.movies_df
+        if df.empty:
+            return np.empty(0, dtype=np.intp)
+        va = pd.to_numeric(df['vote_average'], errors='coerce').to_numpy(dtype=float, na_value=0.0)
+        vc = pd.to_numeric(df['vote_count'], errors='coerce').to_numpy(dtype=float, na_value=0.0)
+        # stable sort, so ties keep frame order like sort_values/nlargest did
+        rank = np.lexsort((-vc, -va))
+        return rank[va[rank] >= 6.0]
+
+    @cached_property
+    def lang_index(self) -> Dict[str, np.ndarray]:
+        """Rank-ordered row positions per language."""
+        if self.movies_df.empty:
+            return {}
+        rank = self.ranked_positions
+        langs = pd.Series(self.movies_df['original_language'].to_numpy()[rank], index=rank)
+        return {k: v.to_numpy() for k, v in langs.groupby(langs, sort=False).groups.items()}
+
+    @cached_property
+    def genre_masks(self) -> Optional[Dict[str, np.ndarray]]:
+        """Boolean row-membership mask per lower-cased genre token, or None without a genres column."""
+        if self.movies_df.empty or 'genres' not in self.movies_df.columns:
+            return None
+        n = len(self.movies_df)
+        genres = pd.Series(self.movies_df['genres'].fillna('').astype(str).to_numpy(), index=np.arange(n))
+        tokens = genres.str.lower().str.split(',').explode().str.strip()
+        tokens = tokens[tokens != '']
+        masks = {}
+        for token, rows in tokens.groupby(tokens, sort=False).groups.items():
+            mask = np.zeros(n, dtype=bool)
+            mask[rows.to_numpy()] = True
+            masks[token] = mask
+        return masks
+
     def fetch_imdb_poster(self, imdb_id: str) -> str:
         return ''
 
     def enhance_posters(self, limit: int = 50):
         return
 
+    def source_fingerprint(self) -> str:
+        """Hash of the source CSVs' paths, sizes and mtimes, used to invalidate the cache."""
+        h = hashlib.sha1()
+        for path in (self.data_path, self.indian_path, self.imdb_path):
+            st = os.stat(path) if os.path.exists(path) else None
+            h.update(f"{path}:{st.st_size}:{st.st_mtime_ns};".encode() if st else f"{path}:missing;".encode())
+        return h.hexdigest()
+
     def load_from_cache(self) -> bool:
-        if not os.path.exists(self.cache_file):
+        movies_path = os.path.join(self.cache_dir, 'movies.feather')
+        interactions_path = os.path.join(self.cache_dir, 'interactions.feather')
+        if not (os.path.exists(movies_path) and os.path.exists(interactions_path)):
             return False
-        age = time.time() - os.path.getmtime(self.cache_file)
+        age = time.time() - os.path.getmtime(movies_path)
         if age > 24 * 3600:
             return False
         try:
-            with open(self.cache_file, 'rb') as f:
-                data = pickle.load(f)
-            self.movies_df = data.get('movies_df', pd.DataFrame())
-            self.interactions_df = data.get('interactions_df', pd.DataFrame())
+            # uncompressed Feather + memory_map: column buffers stay backed by the OS page cache
+            tbl = feather.read_table(movies_path, memory_map=True)
+            if (tbl.schema.metadata or {}).get(b'fingerprint', b'').decode() != self.source_fingerprint():
+                return False
+            # the frame index doubles as the public movie id, so it is stored as a column
+            self.movies_df = tbl.to_pandas(types_mapper=pd.ArrowDtype).set_index('movie_idx').rename_axis(None)
+            self.interactions_df = feather.read_table(interactions_path, memory_map=True).to_pandas()
+            if 'title_norm' not in self.movies_df.columns:
+                self.add_title_norm()
             self.is_loaded = True
             return True
         except Exception:
@@ -205,9 +335,16 @@ class MovieRecommendationAPI:
 
     def save_to_cache(self):
         try:
-            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump({'movies_df': self.movies_df, 'interactions_df': self.interactions_df}, f)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            movies = self.movies_df.rename_axis('movie_idx').reset_index()
+            # Arrow can't store object columns holding mixed types (e.g. int and 'indian_x' ids)
+            obj_cols = movies.select_dtypes(include='object').columns
+            movies = movies.astype({c: 'string' for c in obj_cols})
+            tbl = pa.Table.from_pandas(movies, preserve_index=False)
+            tbl = tbl.replace_schema_metadata({**(tbl.schema.metadata or {}), b'fingerprint': self.source_fingerprint().encode()})
+            feather.write_feather(tbl, os.path.join(self.cache_dir, 'movies.feather'), compression='uncompressed')
+            feather.write_feather(self.interactions_df.reset_index(drop=True),
+                                  os.path.join(self.cache_dir, 'interactions.feather'), compression='uncompressed')
         except Exception:
             pass
 
@@ -215,59 +352,86 @@ class MovieRecommendationAPI:
         if self.movies_df.empty:
             self.interactions_df = pd.DataFrame()
             return
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_users = 500
         sample_pool = self.movies_df.nlargest(min(3000, len(self.movies_df)), 'vote_count') if 'vote_count' in self.movies_df.columns else self.movies_df
         n_interactions = 12000
-        user_ids = np.random.randint(1, n_users + 1, n_interactions)
-        movie_indices = np.random.choice(sample_pool.index, n_interactions)
-        def pick_rating(avg):
-            return (np.random.choice([4,5], p=[0.3,0.7]) if avg>=8 else
-                    np.random.choice([3,4,5], p=[0.2,0.4,0.4]) if avg>=7 else
-                    np.random.choice([1,2,3,4,5], p=[0.1,0.1,0.2,0.3,0.3]))
-        ratings = [pick_rating(safe_float(self.movies_df.loc[idx,'vote_average']) if 'vote_average' in self.movies_df.columns else 3.0) for idx in movie_indices]
-        self.interactions_df = pd.DataFrame({'user_id': user_ids, 'movie_id': movie_indices, 'rating': ratings}).drop_duplicates(['user_id','movie_id'])
+        user_ids = rng.integers(1, n_users + 1, n_interactions)
+        pos = rng.integers(0, len(sample_pool), n_interactions)
+        movie_indices = sample_pool.index.to_numpy()[pos]
+        if 'vote_average' in sample_pool.columns:
+            avgs = pd.to_numeric(sample_pool['vote_average'], errors='coerce').to_numpy(dtype=float, na_value=0.0)[pos]
+        else:
+            avgs = np.full(n_interactions, 3.0)
+
+        # bucket by average rating, then draw each bucket's ratings in one call
+        bucket = np.where(avgs >= 8, 0, np.where(avgs >= 7, 1, 2))
+        ratings = np.empty(n_interactions, dtype=np.int8)
+        rating_dists = [([4, 5], [0.3, 0.7]), ([3, 4, 5], [0.2, 0.4, 0.4]), ([1, 2, 3, 4, 5], [0.1, 0.1, 0.2, 0.3, 0.3])]
+        for b, (vals, probs) in enumerate(rating_dists):
+            m = bucket == b
+            ratings[m] = rng.choice(vals, size=int(m.sum()), p=probs)
+
+        # dedupe (user_id, movie_id) via one int64 key; sorting the first-occurrence
+        # indices keeps drop_duplicates' keep='first' row order
+        movie_indices = movie_indices.astype(np.int64)
+        key = (user_ids.astype(np.int64) << 32) | movie_indices
+        _, first = np.unique(key, return_index=True)
+        first.sort()
+        self.interactions_df = pd.DataFrame({'user_id': user_ids[first], 'movie_id': movie_indices[first], 'rating': ratings[first]})
 
     def get_recommendations(self, genre: str, language: str, excluded_ids: List[Any] = None, limit: int = 1) -> Dict[str, Any]:
         if not self.is_loaded:
             return {"error": "not loaded", "recommendations": []}
-        excluded_ids = set(excluded_ids or [])
+        # sorted, de-duplicated int64 ids: lets np.isin take its assume_unique fast path
+        excluded = np.unique(np.asarray(list(excluded_ids or ()), dtype=np.int64))
 
-        df = self.movies_df.loc[~self.movies_df.index.isin(excluded_ids)].copy()
-        df = df[(df['vote_average'] >= 6.0) & (df['original_language'] == language)]
-        if 'genres' in df.columns and genre:
-            df = df[df['genres'].str.contains(genre, case=False, na=False)]
-
-        df['vote_average'] = pd.to_numeric(df.get('vote_average', 0), errors='coerce').fillna(0.0)
-        df['vote_count'] = pd.to_numeric(df.get('vote_count', 0), errors='coerce').fillna(0).astype(int)
-        df = df.sort_values(['vote_average', 'vote_count'], ascending=[False, False])
+        # rank-ordered row positions for the language; vote_average >= 6 is applied at index build time
+        pos = self.lang_index.get(language, np.empty(0, dtype=np.intp))
+        if self.genre_masks is not None and genre:
+            # OR every genre token containing the query, matching the old case-insensitive contains
+            q = genre.lower()
+            hits = [m for k, m in self.genre_masks.items() if q in k]
+            pos = pos[np.logical_or.reduce(hits)[pos]] if hits else pos[:0]
 
         excluded_titles = set()
-        if excluded_ids:
-            existing = self.movies_df.loc[self.movies_df.index.isin(excluded_ids), 'title'].dropna().str.lower()
-            excluded_titles = set(existing.tolist())
-
-        movies = []
-        seen = set()
-        for idx, m in df.iterrows():
-            title_norm = str(m.get('title', '')).strip().lower()
-            if not title_norm or title_norm in seen or title_norm in excluded_titles:
-                continue
-            avg = safe_float(m.get('vote_average', 0))
-            movies.append({
-                'id': int(idx),
-                'title': str(m.get('title', 'Unknown')),
-                'vote_average': avg,
-                'vote_count': safe_int(m.get('vote_count', 0)),
-                'release_date': str(m.get('release_date', '')),
-                'overview': str(m.get('overview', '')),
-                'genres': str(m.get('genres', '')),
-                'original_language': str(m.get('original_language', language)),
-                'poster_path': str(m.get('poster_path', '')),
-            })
-            seen.add(title_norm)
-            if len(movies) >= limit:
+        if excluded.size:
+            exc_pos = self.movies_df.index.get_indexer(excluded)
+            exc_pos = exc_pos[exc_pos >= 0]
+            pos = pos[~np.isin(pos, exc_pos, assume_unique=True)]
+            excluded_titles = set(self.movies_df['title_norm'].iloc[exc_pos])
+
+        # walk a small prefix of the ranking; widen it only when dedupe/exclusion
+        # leaves fewer than `limit` rows
+        k = max(limit, 1) * 4
+        while True:
+            cand = self.movies_df.iloc[pos[:k]]
+            cand = cand[(cand['title_norm'] != '') & ~cand['title_norm'].isin(excluded_titles)]
+            cand = cand.drop_duplicates('title_norm').head(limit)
+            if len(cand) >= limit or k >= len(pos):
                 break
+            k *= 4
+
+        def column(name, default):
+            return cand[name].to_numpy() if name in cand.columns else [default] * len(cand)
+
+        movies = [
+            {
+                'id': int(idx),
+                'title': as_text(title, 'Unknown'),
+                'vote_average': 0.0 if pd.isna(avg) else float(avg),
+                'vote_count': 0 if pd.isna(votes) else int(votes),
+                'release_date': as_text(release_date),
+                'overview': as_text(overview),
+                'genres': as_text(genres),
+                'original_language': as_text(lang, language),
+                'poster_path': as_text(poster),
+            }
+            for idx, title, avg, votes, release_date, overview, genres, lang, poster in zip(
+                cand.index.to_numpy(), column('title', 'Unknown'), column('vote_average', 0.0),
+                column('vote_count', 0), column('release_date', ''), column('overview', ''),
+                column('genres', ''), column('original_language', language), column('poster_path', ''))
+        ]
         return {'success': True, 'recommendations': movies, 'total': len(movies), 'filters': {'genre': genre, 'language': language}}
 
     def get_genres(self) -> List[str]:
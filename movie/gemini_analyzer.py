@@ -2,20 +2,178 @@
 Gemini AI Movie Analyzer
 Provides detailed analysis of recommended movies using Google's Gemini AI
 """
+import io
 import os
+import asyncio
+import importlib.util
+import re
 import sys
-from typing import Dict, Any, Optional
+import atexit
+import hashlib
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
 
-# Matplotlib for saving intensity graphs (use non-interactive backend)
+logger = logging.getLogger(__name__)
+
+# httpx enables the asyncio batch path (analyze_movies_async); threads are used without it
 try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson is much faster for the intensity cache; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PyArrow's multithreaded CSV reader loads the title lookup dataset; pandas without it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+
+# Parsed cache logs shared by analyzers in this process: path -> (st_size, st_mtime_ns, record count, entries)
+_CACHE_MEMO: Dict[str, Tuple[int, int, int, Dict[str, Any]]] = {}
+_CACHE_MEMO_LOCK = threading.Lock()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialise to UTF-8 JSON bytes (compact, or 2-space indented), using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _safe_filename(title: str) -> str:
+    """Replace characters that are unsafe in filenames with '_'"""
+    return UNSAFE_FILENAME_RE.sub('_', title)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cache_key(movie_id: Any, title: Optional[str], release_date: Optional[str]) -> str:
+    """Build the intensity cache key; memoized since a movie is keyed several times per analysis"""
+    # Use movie ID if available, otherwise use title + release date
+    if movie_id:
+        return f"id_{movie_id}"
+    title = title.lower().replace(' ', '_')
+    year = release_date[:4] if release_date else 'unknown'
+    return f"{title}_{year}"
+
+# "<segment>: N/10" score lines in the Gemini intensity response, matched in one pass
+SEGMENT_SCORE_RE = re.compile(r'(beginning|first\s+half|interval|second\s+half|climax)[:\-\s]+(\d+)/10', re.IGNORECASE)
+# Runtime segments in plot order
+SEGMENT_ORDER = ('beginning', 'first_half', 'interval', 'second_half', 'climax')
+
+# A score line immediately followed by its "Description: ..." line
+SEGMENT_DESCRIPTION_RE = re.compile(
+    r'(beginning|first\s+half|interval|second\s+half|climax)[:\-\s]+\d+/10[^\n]*\n\s*[^\w\n]*description[^\w\n]*:[^\S\n]*([^\n]*)',
+    re.IGNORECASE
+)
+# "Overall Intensity Arc: ...", "Peak Moments: ...", "Pacing Assessment: ..." summary lines
+SUMMARY_LINE_RE = re.compile(
+    r'^[^\w\n]*(overall(?:\s+intensity)?\s+arc|peak\s+moments?|pacing(?:\s+assessment)?)[^\w\n]*:[^\S\n]*([^\n]*)',
+    re.IGNORECASE | re.MULTILINE
+)
+SUMMARY_FIELDS = {'overall': 'overall_arc', 'peak': 'peak_moments', 'pacing': 'pacing_assessment'}
+WS_RE = re.compile(r'\s+')
+# IMDb's public GraphQL API serves the same user reviews as the /reviews page, as JSON
+IMDB_GRAPHQL_URL = "https://api.graphql.imdb.com/"
+IMDB_REVIEWS_QUERY = """
+query TitleReviews($id: ID!, $first: Int!, $after: ID) {
+  title(id: $id) {
+    reviews(first: $first, after: $after) {
+      edges { node { spoiler text { originalText { plainText } } } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Review containers on the current and legacy IMDb reviews page layouts
+REVIEW_ITEMS_CSS = "article[class*='user-review-item'], div.review-container"
+
+# Collects the non-spoiler review texts on an IMDb reviews page in one WebDriver round-trip, starting
+# at article index arguments[0] so earlier batches are not re-extracted after each "load more"
+REVIEW_TEXTS_JS = """
+let articles = document.querySelectorAll("article[class*='user-review-item']");
+if (!articles.length) articles = document.querySelectorAll("div.review-container");
+const texts = Array.from(articles).slice(arguments[0] || 0)
+    .filter(a => !a.querySelector('div[data-testid="review-spoiler-content"]'))
+    .map(a => {
+        const e = a.querySelector("div.ipc-html-content-inner-div") || a.querySelector("div.text.show-more__control") || a.querySelector("div.content");
+        return e ? e.innerText.trim() : null;
+    })
+    .filter(Boolean);
+return {scanned: articles.length, texts: texts};
+"""
+
+# Keeps window.__reviewCount up to date with a MutationObserver so waits can poll a number instead of
+# re-running a find_elements DOM query every tick
+REVIEW_COUNT_OBSERVER_JS = """
+const css = arguments[0];
+window.__reviewCount = document.querySelectorAll(css).length;
+new MutationObserver(() => { window.__reviewCount = document.querySelectorAll(css).length; })
+    .observe(document.body, {childList: true, subtree: true});
+"""
+
+# Seconds to wait for a "load more" click to render new reviews before giving up on the page
+LOAD_MORE_TIMEOUT = 4
+
+# Clicks the enabled "load more" button and returns the review count before the click (-1 if there is
+# no button), replacing a find_element lookup, a count, a scroll and a click with one round-trip
+LOAD_MORE_JS = """
+const btn = document.querySelector("button.ipc-see-more__button:not([aria-disabled='true'])");
+if (!btn) return -1;
+const count = document.querySelectorAll(arguments[0]).length;
+btn.scrollIntoView({block: 'center'});
+btn.click();
+return count;
+"""
+
+# Mock intensity curves by genre, in priority order (first genre present wins)
+MOCK_GENRE_SCORES = {
+    'action': [6, 7, 8, 9, 10],
+    'thriller': [6, 7, 8, 9, 10],
+    'drama': [5, 6, 7, 8, 7],
+    'comedy': [6, 6, 5, 7, 8],
+    'horror': [7, 6, 5, 8, 9],
+}
+MOCK_DEFAULT_SCORES = [6, 7, 7, 8, 9]
+GENRE_SPLIT_RE = re.compile(r'[,\s/|]+')
+
+# Anything other than letters/digits (any script), space, '-' or '_' is replaced in filenames
+UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+
+# Matplotlib for saving intensity graphs (object API on the Agg canvas, no pyplot state)
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
 except Exception:
-    plt = None
+    Figure = None
 
 # Try to load .env file if python-dotenv is available
 try:
@@ -29,6 +187,203 @@ except ImportError:
     pass
 
 
+# Title/IMDb ID lookup table used by the analysis API route
+DATASET_PATH = Path(__file__).parent.parent / 'tmdb_movies_since_1971.csv'
+
+
+@lru_cache(maxsize=4)
+def _title_index(path: str):
+    """Load the dataset once per process and map lowercased title -> first row position"""
+    if pacsv is not None:
+        tbl = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                column_types={'release_date': pa.string(), 'imdb_id': pa.string()},
+                strings_can_be_null=True,
+            ),
+        )
+        lowered = pc.utf8_lower(tbl['title']).to_pylist()
+    else:
+        import pandas as pd
+        tbl = pd.read_csv(path)
+        lowered = tbl['title'].str.lower().tolist()
+    # Iterate backwards so the first row for a duplicated title wins, matching iloc[0]
+    index = dict(zip(reversed(lowered), range(len(lowered) - 1, -1, -1)))
+    return tbl, index
+
+
+def find_movie_by_title(title: str, dataset_path: Path = DATASET_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Look up a movie by (case-insensitive) title in the TMDB dataset
+    
+    Args:
+        title: Movie title
+        dataset_path: CSV with at least title and imdb_id columns
+    
+    Returns:
+        The first matching row as a JSON-ready dict (NaN -> None), or None if not found
+    """
+    tbl, index = _title_index(str(dataset_path))
+    pos = index.get(str(title).lower())
+    if pos is None:
+        return None
+    if pacsv is not None:
+        # Arrow rows come back as plain Python values with nulls as None
+        return tbl.slice(pos, 1).to_pylist()[0]
+    movie = {}
+    for key, value in tbl.iloc[pos].items():
+        if value is None or (isinstance(value, float) and value != value):
+            movie[key] = None
+        elif hasattr(value, 'item'):
+            movie[key] = value.item()
+        else:
+            movie[key] = value
+    return movie
+
+
+def resolve_imdb_id(title: str, dataset_path: Path = DATASET_PATH) -> Optional[str]:
+    """IMDb ID for a title from the TMDB dataset (same cached index as find_movie_by_title), or None"""
+    movie = find_movie_by_title(title, dataset_path)
+    return (movie or {}).get('imdb_id') or None
+
+
+# Resources the scraper never needs; blocked via CDP so review pages load less
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm", "*.css",
+    "*/ads/*", "*doubleclick*", "*google-analytics*", "*googletagmanager*", "*amazon-adsystem*",
+]
+
+CHROME_DISABLE_FLAGS = [
+    "--disable-extensions", "--disable-background-networking", "--disable-sync", "--disable-translate",
+    "--disable-default-apps", "--mute-audio", "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI", "--no-first-run",
+]
+
+
+def _chrome_service():
+    """Chrome service for CHROMEDRIVER_PATH if set, else one Selenium Manager resolves (and caches) itself"""
+    from selenium.webdriver.chrome.service import Service
+    
+    path = os.getenv('CHROMEDRIVER_PATH')
+    return Service(path) if path else Service()
+
+
+def _start_chrome():
+    """Start a headless Chrome configured for review scraping"""
+    from selenium import webdriver
+    
+    # Setup Chrome in headless mode
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = "eager"
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    # Browser features a scraper never uses; skipping them shortens startup and per-page work
+    for flag in CHROME_DISABLE_FLAGS:
+        options.add_argument(flag)
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    
+    print(f"DEBUG: Starting Chrome driver...", file=sys.stderr)
+    driver = webdriver.Chrome(service=_chrome_service(), options=options)
+    driver.set_page_load_timeout(45)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"DEBUG: Could not block page resources: {e}", file=sys.stderr)
+    return driver
+
+
+class _DriverPool:
+    """Headless Chrome drivers shared by every analyzer in the process, started on demand up to max_size"""
+    
+    def __init__(self, max_size: int):
+        # With no slots, a checkout would wait forever for a driver that can never be started
+        self.max_size = max(1, max_size)
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._size = 0
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+    
+    @contextmanager
+    def acquire(self):
+        """Check out a driver for one scrape; a driver that raised is quit instead of returned"""
+        driver = self._checkout()
+        try:
+            driver.delete_all_cookies()
+            yield driver
+        except BaseException:
+            # Don't reuse a browser left in an unknown state
+            self._discard(driver)
+            raise
+        self._idle.put(driver)
+    
+    def _checkout(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                start_new = self._size < self.max_size
+                if start_new:
+                    self._size += 1
+            if start_new:
+                try:
+                    driver = _start_chrome()
+                except BaseException:
+                    with self._lock:
+                        self._size -= 1
+                    raise
+                with self._lock:
+                    self._drivers.append(driver)
+                return driver
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                # Re-check capacity: a failed driver may have freed its slot
+                continue
+    
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._size -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every pooled driver"""
+        with self._lock:
+            drivers, self._drivers, self._size = self._drivers, [], 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# CHROME_POOL_SIZE caps how many browsers scrape at once
+def _chrome_pool_size() -> int:
+    """CHROME_POOL_SIZE as a positive int (default 4); a bad value must not break importing this module"""
+    try:
+        size = int(os.getenv('CHROME_POOL_SIZE', '4'))
+    except ValueError:
+        print(f"Warning: invalid CHROME_POOL_SIZE {os.getenv('CHROME_POOL_SIZE')!r}, using 4", file=sys.stderr)
+        size = 4
+    return max(1, size)
+
+
+_DRIVER_POOL = _DriverPool(max_size=_chrome_pool_size())
+
+
 class MovieAnalyzer:
     """
     Analyzes movies using Google Gemini AI to provide insights,
@@ -49,29 +404,108 @@ class MovieAnalyzer:
         if not self.use_mock:
             self.api_url = f"https://generativelanguage.googleapis.com/v1/models/gemini-2.0-flash:generateContent?key={self.api_key}"
         
-        # Cache file path
-        self.cache_file = Path(__file__).parent / 'intensity_cache.json'
+        # Keep-alive HTTP session, created on first API call
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # Guards intensity_cache / cache file and the shared figure when analyzing concurrently
+        self._cache_lock = threading.RLock()
+        self._plot_lock = threading.Lock()
+        
+        # Parsed review temp files: imdb_id -> (file mtime_ns, review texts)
+        self._reviews_mem_cache: Dict[str, Tuple[int, List[str]]] = {}
+        
+        # One figure/canvas per analyzer, cleared and redrawn for every intensity graph
+        self._fig = None
+        if Figure is not None:
+            self._fig = Figure(figsize=(6, 3.5), dpi=100)
+            self._canvas = FigureCanvasAgg(self._fig)
+            # Fixed margins instead of a tight_layout solve on every plot
+            self._fig.subplots_adjust(left=0.1, right=0.98, top=0.9, bottom=0.15)
+        
+        # Append-only cache log (one {cache_key: entry} record per line, later lines win);
+        # intensity_cache.json is the old single-document format, migrated on first load
+        self.cache_file = Path(__file__).parent / 'intensity_cache.jsonl'
+        self.legacy_cache_file = Path(__file__).parent / 'intensity_cache.json'
+        self._dirty_keys = set()
+        self._cache_records = 0
         self._load_cache()
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared pooled session, creating it on first use (thread-safe)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    retry = Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset({'POST'}),
+                        raise_on_status=False,
+                    )
+                    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+                    self._session = session
+        return self._session
     
 
     def _load_cache(self):
-        """Load intensity cache from JSON file"""
+        """Load intensity cache by replaying the JSONL log (reusing this process's parse if the file is unchanged)"""
+        self.intensity_cache = {}
+        self._cache_records = 0
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.intensity_cache = json.load(f)
-            else:
-                self.intensity_cache = {}
+            try:
+                st = self.cache_file.stat()
+            except OSError:
+                st = None
+            if st is not None:
+                with _CACHE_MEMO_LOCK:
+                    memo = _CACHE_MEMO.get(str(self.cache_file))
+                if memo is not None and memo[:2] == (st.st_size, st.st_mtime_ns):
+                    # Entries are shared between analyzers and never mutated in place
+                    self._cache_records = memo[2]
+                    self.intensity_cache = dict(memo[3])
+                    return
+                
+                entries, records, torn = self._replay_cache_log()
+                self.intensity_cache = dict(entries)
+                self._cache_records = records
+                if torn:
+                    # Torn line from an interrupted write; compaction drops it
+                    self._compact_cache(entries)
+                else:
+                    self._remember_cache(entries, records, st)
+            elif self.legacy_cache_file.exists():
+                self.intensity_cache = _read_json(self.legacy_cache_file)
+                self._compact_cache(dict(self.intensity_cache))
         except Exception as e:
             print(f"Warning: Could not load cache: {e}")
             self.intensity_cache = {}
 
+    def _replay_cache_log(self) -> Tuple[Dict[str, Any], int, bool]:
+        """Replay the JSONL log into (entries, record count, whether a torn line was skipped)"""
+        entries = {}
+        records = 0
+        torn = False
+        with open(self.cache_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    torn = True
+                    continue
+                entries.update(record)
+                records += 1
+        return entries, records, torn
+
     def _save_intensity_plot(self, movie: Dict[str, Any], intensity_ratings: Dict[str, Any]) -> Optional[str]:
         """Save a matplotlib plot (PNG) for the intensity ratings of a movie.
 
         Returns the path to the saved PNG as a string, or None on failure.
         """
-        if plt is None:
+        if self._fig is None:
             return None
 
         graphs_dir = Path(__file__).parent / 'intensity_graphs'
@@ -82,68 +516,215 @@ class MovieAnalyzer:
 
         title = str(movie.get('title', 'unknown'))
         movie_id = movie.get('id')
-        safe_title = ''.join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in title).strip().replace(' ', '_')
+        safe_title = _safe_filename(title).strip().replace(' ', '_')
         filename = f"{safe_title}"
         if movie_id:
             filename = f"{movie_id}_{filename}"
-        out_path = graphs_dir / f"{filename}.png"
 
         labels = ['Beginning', 'First Half', 'Interval', 'Second Half', 'Climax']
         try:
-            scores = [
-                int(intensity_ratings.get('beginning', {}).get('score', 0)),
-                int(intensity_ratings.get('first_half', {}).get('score', 0)),
-                int(intensity_ratings.get('interval', {}).get('score', 0)),
-                int(intensity_ratings.get('second_half', {}).get('score', 0)),
-                int(intensity_ratings.get('climax', {}).get('score', 0)),
-            ]
+            ratings = intensity_ratings or {}
+            scores = [int((ratings.get(segment) or {}).get('score') or 0) for segment in SEGMENT_ORDER]
         except Exception:
             return None
 
+        # Key the file on the scores so changed ratings get a fresh plot and unchanged ones skip drawing
+        scores_digest = hashlib.blake2b(','.join(map(str, scores)).encode('ascii'), digest_size=4).hexdigest()
+        out_path = graphs_dir / f"{filename}_{scores_digest}.png"
+        if out_path.exists():
+            return str(out_path)
+
+        # The figure is shared, so concurrent analyses draw one at a time
+        self._plot_lock.acquire()
         try:
-            plt.figure(figsize=(6, 3.5))
-            bars = plt.bar(labels, scores, color=['#60a5fa', '#f59e0b', '#f97316', '#ef4444', '#dc2626'])
-            plt.ylim(0, 10)
-            plt.ylabel('Intensity (0-10)')
-            plt.title(f"Intensity Progression — {title}")
+            self._fig.clear()
+            ax = self._fig.add_subplot(111)
+            bars = ax.bar(labels, scores, color=['#60a5fa', '#f59e0b', '#f97316', '#ef4444', '#dc2626'])
+            ax.set_ylim(0, 10)
+            ax.set_ylabel('Intensity (0-10)')
+            ax.set_title(f"Intensity Progression — {title}")
             for bar, val in zip(bars, scores):
-                plt.text(bar.get_x() + bar.get_width() / 2, val + 0.2, str(val), ha='center', va='bottom', fontsize=9)
-            plt.tight_layout()
-            # Save to internal folder first
-            plt.savefig(out_path, dpi=150)
+                ax.text(bar.get_x() + bar.get_width() / 2, val + 0.2, str(val), ha='center', va='bottom', fontsize=9)
+            # Encode in memory, then save to internal folder in a single write
+            buf = io.BytesIO()
+            self._canvas.print_png(buf)
+            out_path.write_bytes(buf.getvalue())
 
             # Return the internal filesystem path for now (saved in movie/intensity_graphs)
-            try:
-                plt.close()
-            except Exception:
-                pass
             return str(out_path)
         except Exception:
-            try:
-                plt.close()
-            except Exception:
-                pass
             return None
+        finally:
+            self._plot_lock.release()
     
     def _save_cache(self):
-        """Save intensity cache to JSON file"""
+        """Append entries changed since the last save to the JSONL cache log"""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.intensity_cache, f, indent=2, ensure_ascii=False)
+            with self._cache_lock:
+                if not self._dirty_keys:
+                    return
+                appended = {key: self.intensity_cache[key] for key in self._dirty_keys if key in self.intensity_cache}
+                data = b''.join(_dump_json({key: entry}) + b'\n' for key, entry in appended.items())
+                try:
+                    before = self.cache_file.stat()
+                except OSError:
+                    before = None
+                with open(self.cache_file, 'ab') as f:
+                    f.write(data)
+                self._cache_records += len(appended)
+                self._dirty_keys.clear()
+                self._extend_cache_memo(before, appended, len(data))
+                self._maybe_compact_cache()
         except Exception as e:
             print(f"Warning: Could not save cache: {e}")
+
+    def _remember_cache(self, entries: Dict[str, Any], records: int, st: Optional[os.stat_result] = None):
+        """Record a full replay/rewrite of the log against its size/mtime for later analyzers"""
+        try:
+            st = st or self.cache_file.stat()
+        except OSError:
+            return
+        with _CACHE_MEMO_LOCK:
+            _CACHE_MEMO[str(self.cache_file)] = (st.st_size, st.st_mtime_ns, records, entries)
+
+    def _extend_cache_memo(self, before: Optional[os.stat_result], appended: Dict[str, Any], nbytes: int):
+        """
+        Fold an append into the memo, but only if the memo described the whole file right before it
+        and nothing else wrote in between; otherwise drop it so the next analyzer replays the log
+        """
+        key = str(self.cache_file)
+        with _CACHE_MEMO_LOCK:
+            memo = _CACHE_MEMO.pop(key, None)
+            if memo is None or before is None or memo[:2] != (before.st_size, before.st_mtime_ns):
+                return
+            try:
+                st = self.cache_file.stat()
+            except OSError:
+                return
+            if st.st_size != before.st_size + nbytes:
+                return
+            entries = dict(memo[3])
+            entries.update(appended)
+            _CACHE_MEMO[key] = (st.st_size, st.st_mtime_ns, memo[2] + len(appended), entries)
+
+    def _maybe_compact_cache(self):
+        """Rewrite the log once superseded records make it twice the live size"""
+        if self._cache_records > 2 * max(len(self.intensity_cache), 1):
+            self._compact_cache()
+
+    def _compact_cache(self, entries: Optional[Dict[str, Any]] = None):
+        """
+        Rewrite the log with one record per cache key
+        
+        Without entries (a full replay), the log is re-read first: other analyzers may have appended
+        keys this one never loaded, and the rewrite must not drop them.
+        """
+        try:
+            with self._cache_lock:
+                if entries is None:
+                    entries = self._replay_cache_log()[0] if self.cache_file.exists() else dict(self.intensity_cache)
+                tmp_file = self.cache_file.with_suffix('.jsonl.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(b''.join(_dump_json({key: entry}) + b'\n' for key, entry in entries.items()))
+                os.replace(tmp_file, self.cache_file)
+                self._cache_records = len(entries)
+                self._remember_cache(dict(entries), len(entries))
+                # Pick up keys written by others, keeping this analyzer's unsaved results
+                for key, entry in entries.items():
+                    if key not in self._dirty_keys:
+                        self.intensity_cache[key] = entry
+        except Exception as e:
+            print(f"Warning: Could not compact cache: {e}")
     
     def _get_cache_key(self, movie: Dict[str, Any]) -> str:
         """Generate unique cache key for a movie"""
-        # Use movie ID if available, otherwise use title + release date
-        if 'id' in movie and movie['id']:
-            return f"id_{movie['id']}"
-        else:
-            title = movie.get('title', 'unknown').lower().replace(' ', '_')
-            year = movie.get('release_date', '')[:4] if movie.get('release_date') else 'unknown'
-            return f"{title}_{year}"
+        movie_id = movie.get('id')
+        if movie_id:
+            return _cache_key(movie_id, None, None)
+        return _cache_key(None, movie.get('title', 'unknown'), movie.get('release_date'))
     
-    def analyze_movie_intensity(self, movie: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_movies(self, movies: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Analyze several movies concurrently
+        Each analysis mostly waits on the Gemini API and review scraping, so threads
+        overlap that I/O; new cache entries are appended once after all analyses finish
+        
+        Args:
+            movies: List of movie dictionaries (same shape as analyze_movie_intensity)
+            max_workers: Maximum number of analyses in flight
+        
+        Returns:
+            List of intensity results, in the same order as movies
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(movies)
+        if not movies:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.analyze_movie_intensity, movie, False): i for i, movie in enumerate(movies)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = self._intensity_error(movies[i], e)
+        self._save_cache()
+        return results
+
+    async def analyze_movies_async(self, movies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several movies concurrently on the running event loop
+        Gemini calls share one httpx.AsyncClient (HTTP/2 when h2 is installed); review
+        scraping, parsing and plotting run in worker threads. Falls back to
+        analyze_movies when httpx is not installed
+        
+        Args:
+            movies: List of movie dictionaries (same shape as analyze_movie_intensity)
+        
+        Returns:
+            List of intensity results, in the same order as movies
+        """
+        if not movies:
+            return []
+        if httpx is None:
+            return await asyncio.to_thread(self.analyze_movies, movies)
+        
+        async with httpx.AsyncClient(
+            http2=importlib.util.find_spec('h2') is not None,
+            timeout=httpx.Timeout(5.0, read=30.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=64),
+        ) as client:
+            results = await asyncio.gather(*(self._analyze_movie_intensity_async(client, movie) for movie in movies))
+        await asyncio.to_thread(self._save_cache)
+        return list(results)
+
+    async def _analyze_movie_intensity_async(self, client, movie: Dict[str, Any]) -> Dict[str, Any]:
+        """analyze_movie_intensity with the Gemini request awaited on client (cache written by the caller)"""
+        try:
+            cache_key = self._get_cache_key(movie)
+            cached_data = self._get_cached_intensity(movie, cache_key)
+            if cached_data is not None:
+                return cached_data
+            
+            prompt = await asyncio.to_thread(self._build_intensity_prompt, movie)
+            if self.use_mock:
+                response_text = self._generate_mock_analysis(movie)
+            else:
+                response_text = await self._call_gemini_api_async(client, prompt)
+            return await asyncio.to_thread(self._finish_intensity_analysis, movie, cache_key, response_text, False)
+        except Exception as e:
+            return self._intensity_error(movie, e)
+
+    def _intensity_error(self, movie: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Result returned when analyzing a movie fails"""
+        return {
+            'success': False,
+            'error': str(error),
+            'movie_title': str(movie.get('title', 'Unknown')),
+            'movie_id': movie.get('id', None),
+            'cached': False
+        }
+
+    def analyze_movie_intensity(self, movie: Dict[str, Any], save_cache: bool = True) -> Dict[str, Any]:
         """
         Analyze movie intensity across different runtime segments
         Uses cache to avoid re-analyzing the same movie
@@ -151,38 +732,78 @@ class MovieAnalyzer:
         Args:
             movie: Dictionary containing movie information (single recommendation)
                    Expected keys: title, overview, genres, vote_average, etc.
+            save_cache: Write the cache file after updating it (analyze_movies batches this)
         
         Returns:
             Dictionary with intensity ratings for each segment
         """
         # Check cache first
         cache_key = self._get_cache_key(movie)
-        if cache_key in self.intensity_cache:
-            cached_data = self.intensity_cache[cache_key].copy()
-            cached_data['success'] = True
-            cached_data['cached'] = True
-            cached_data['movie_title'] = str(movie.get('title', 'Unknown'))
-            cached_data['movie_id'] = movie.get('id', None)
-            # include plot path if available in cache
-            cached_data['plot_path'] = self.intensity_cache.get(cache_key, {}).get('plot_path')
-
-            # If cache exists but plot is missing, try to generate it now (non-blocking best-effort)
-            if not cached_data.get('plot_path'):
-                try:
-                    existing_ratings = self.intensity_cache.get(cache_key, {}).get('intensity_ratings')
-                    if existing_ratings:
-                        plot_path = self._save_intensity_plot(movie, existing_ratings)
-                        if plot_path:
-                            # update persistent cache and returned data
-                            self.intensity_cache[cache_key]['plot_path'] = plot_path
-                            self._save_cache()
-                            cached_data['plot_path'] = plot_path
-                except Exception:
-                    # ignore plotting failures for cache-read path
-                    pass
-
+        cached_data = self._get_cached_intensity(movie, cache_key)
+        if cached_data is not None:
             return cached_data
         
+        # Not in cache, call Gemini API
+        prompt = self._build_intensity_prompt(movie)
+        
+        try:
+            # Use mock data if no valid API key
+            if self.use_mock:
+                response_text = self._generate_mock_analysis(movie)
+            else:
+                response_text = self._call_gemini_api(prompt)
+            
+            return self._finish_intensity_analysis(movie, cache_key, response_text, save_cache)
+        except Exception as e:
+            return self._intensity_error(movie, e)
+
+    def _get_cached_intensity(self, movie: Dict[str, Any], cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for movie (redrawing a missing plot), or None on a cache miss"""
+        with self._cache_lock:
+            cached_entry = self.intensity_cache.get(cache_key)
+            cached_entry = cached_entry.copy() if cached_entry is not None else None
+        if cached_entry is None:
+            return None
+        
+        cached_data = cached_entry
+        cached_data['success'] = True
+        cached_data['cached'] = True
+        cached_data['movie_title'] = str(movie.get('title', 'Unknown'))
+        cached_data['movie_id'] = movie.get('id', None)
+        # include plot path if available in cache (and the file hasn't been deleted since)
+        plot_path = cached_entry.get('plot_path')
+        cached_data['plot_path'] = plot_path if plot_path and os.path.exists(plot_path) else None
+
+        # If cache exists but plot is missing, redraw it now so the response always carries the graph
+        if not cached_data.get('plot_path') and cached_entry.get('intensity_ratings'):
+            cached_data['plot_path'] = self._regenerate_missing_plot(cache_key, movie)
+
+        return cached_data
+
+    def _regenerate_missing_plot(self, cache_key: str, movie: Dict[str, Any]) -> Optional[str]:
+        """Draw the plot for a cached analysis, record its path in the cache and return it (None on failure)"""
+        try:
+            with self._cache_lock:
+                entry = self.intensity_cache.get(cache_key) or {}
+                existing_ratings = entry.get('intensity_ratings')
+            if not existing_ratings:
+                return None
+            plot_path = self._save_intensity_plot(movie, existing_ratings)
+            if plot_path:
+                # update persistent cache
+                with self._cache_lock:
+                    if cache_key in self.intensity_cache:
+                        # Replace rather than mutate: entries may be shared with other analyzers
+                        self.intensity_cache[cache_key] = {**self.intensity_cache[cache_key], 'plot_path': plot_path}
+                        self._dirty_keys.add(cache_key)
+                self._save_cache()
+            return plot_path
+        except Exception:
+            # ignore plotting failures for cache-read path
+            return None
+
+    def _build_intensity_prompt(self, movie: Dict[str, Any]) -> str:
+        """Fetch reviews (when an IMDb ID is available) and build the intensity prompt"""
         # Fetch reviews before analysis (non-blocking, only if IMDb ID is available)
         reviews = []
         if movie.get('imdb_id'):
@@ -193,89 +814,78 @@ class MovieAnalyzer:
         else:
             print(f"ℹ️ No IMDb ID available for '{movie.get('title', 'Unknown')}', skipping review fetch", file=sys.stderr)
         
-        # Not in cache, call Gemini API
-        prompt = self._create_intensity_prompt(movie, reviews)
+        return self._create_intensity_prompt(movie, reviews)
+
+    def _finish_intensity_analysis(self, movie: Dict[str, Any], cache_key: str, response_text: str, save_cache: bool) -> Dict[str, Any]:
+        """Parse a Gemini response, plot it and store it in the cache"""
+        # Debug: Log response for troubleshooting (enable with logging level DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", '=' * 60)
+            logger.debug("GEMINI RESPONSE for '%s':", movie.get('title', 'Unknown'))
+            logger.debug("%s", '=' * 60)
+            logger.debug("%s", response_text[:1000])
+            logger.debug("%s", '=' * 60)
         
+        # Parser returns stripped strings for every text field, ready to cache
+        intensity_data = self._parse_intensity_analysis(response_text)
+        
+        intensity_data['success'] = True
+        intensity_data['cached'] = False
+        intensity_data['movie_title'] = str(movie.get('title', 'Unknown'))
+        intensity_data['movie_id'] = movie.get('id', None)
+        
+        # Save to cache (store only the analysis data, not success/cached flags)
+        cache_data = {
+            'movie_title': str(movie.get('title', 'Unknown')),
+            'movie_id': movie.get('id', None),
+            'genres': movie.get('genres', 'Unknown'),
+            'release_date': movie.get('release_date', 'Unknown'),
+            'intensity_ratings': intensity_data['intensity_ratings'],
+            'overall_arc': intensity_data.get('overall_arc', ''),
+            'peak_moments': intensity_data.get('peak_moments', ''),
+            'pacing_assessment': intensity_data.get('pacing_assessment', ''),
+            'full_analysis': intensity_data.get('full_analysis', '')
+        }
+        # Generate and store plot (if matplotlib available)
         try:
-            # Use mock data if no valid API key
-            if self.use_mock:
-                response_text = self._generate_mock_analysis(movie)
-            else:
-                response_text = self._call_gemini_api(prompt)
-            
-            # Debug: Print response for troubleshooting
-            print(f"\n{'='*60}")
-            print(f"GEMINI RESPONSE for '{movie.get('title', 'Unknown')}':")
-            print(f"{'='*60}")
-            print(response_text[:1000] if len(response_text) > 1000 else response_text)
-            print(f"{'='*60}\n")
-            
-            intensity_data = self._parse_intensity_analysis(response_text)
-            
-            # Clean up any potential JSON-breaking characters in descriptions
-            for segment in intensity_data.get('intensity_ratings', {}).values():
-                if 'description' in segment and segment['description']:
-                    # Ensure description is a clean string
-                    segment['description'] = str(segment['description']).strip()
-            
-            # Clean other text fields
-            for field in ['overall_arc', 'peak_moments', 'pacing_assessment', 'full_analysis']:
-                if field in intensity_data and intensity_data[field]:
-                    intensity_data[field] = str(intensity_data[field]).strip()
-            
-            intensity_data['success'] = True
-            intensity_data['cached'] = False
-            intensity_data['movie_title'] = str(movie.get('title', 'Unknown'))
-            intensity_data['movie_id'] = movie.get('id', None)
-            
-            # Save to cache (store only the analysis data, not success/cached flags)
-            cache_data = {
-                'movie_title': str(movie.get('title', 'Unknown')),
-                'movie_id': movie.get('id', None),
-                'genres': movie.get('genres', 'Unknown'),
-                'release_date': movie.get('release_date', 'Unknown'),
-                'intensity_ratings': intensity_data['intensity_ratings'],
-                'overall_arc': intensity_data.get('overall_arc', ''),
-                'peak_moments': intensity_data.get('peak_moments', ''),
-                'pacing_assessment': intensity_data.get('pacing_assessment', ''),
-                'full_analysis': intensity_data.get('full_analysis', '')
-            }
-            # Generate and store plot (if matplotlib available)
-            try:
-                plot_path = self._save_intensity_plot(movie, cache_data['intensity_ratings'])
-                if plot_path:
-                    cache_data['plot_path'] = plot_path
-            except Exception:
-                cache_data['plot_path'] = None
+            plot_path = self._save_intensity_plot(movie, cache_data['intensity_ratings'])
+            if plot_path:
+                cache_data['plot_path'] = plot_path
+        except Exception:
+            cache_data['plot_path'] = None
 
+        with self._cache_lock:
             self.intensity_cache[cache_key] = cache_data
+            self._dirty_keys.add(cache_key)
+        if save_cache:
             self._save_cache()
 
-            # Include plot path in returned data for frontend use
-            intensity_data['plot_path'] = cache_data.get('plot_path')
-            return intensity_data
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'movie_title': str(movie.get('title', 'Unknown')),
-                'movie_id': movie.get('id', None),
-                'cached': False
-            }
+        # Include plot path in returned data for frontend use
+        intensity_data['plot_path'] = cache_data.get('plot_path')
+        return intensity_data
     
     def _call_gemini_api(self, prompt: str) -> str:
         """Call Gemini API using REST"""
-        payload = {
-            "contents": [{
-                "parts": [{"text": prompt}]
-            }]
-        }
+        # Reuse the pooled keep-alive connection; separate connect/read timeouts
+        response = self._get_session().post(
+            self.api_url,
+            headers={"Content-Type": "application/json"},
+            json=self._gemini_payload(prompt),
+            timeout=(5, 30)
+        )
         
-        response = requests.post(
+        if response.status_code != 200:
+            raise Exception(f"API request failed: {response.status_code} - {response.text}")
+        
+        result = response.json()
+        return result['candidates'][0]['content']['parts'][0]['text']
+    
+    async def _call_gemini_api_async(self, client, prompt: str) -> str:
+        """Call Gemini API using REST on an httpx.AsyncClient"""
+        response = await client.post(
             self.api_url,
             headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=30
+            json=self._gemini_payload(prompt)
         )
         
         if response.status_code != 200:
@@ -284,23 +894,23 @@ class MovieAnalyzer:
         result = response.json()
         return result['candidates'][0]['content']['parts'][0]['text']
     
+    @staticmethod
+    def _gemini_payload(prompt: str) -> Dict[str, Any]:
+        """Request body for a single-prompt generateContent call"""
+        return {
+            "contents": [{
+                "parts": [{"text": prompt}]
+            }]
+        }
+    
     def _generate_mock_analysis(self, movie: Dict[str, Any]) -> str:
         """Generate mock intensity analysis when API key is not available"""
         title = movie.get('title', 'Unknown')
         genres = movie.get('genres', 'Unknown')
         
         # Generate plausible intensity scores based on genre
-        genre_lower = str(genres).lower()
-        if 'action' in genre_lower or 'thriller' in genre_lower:
-            scores = [6, 7, 8, 9, 10]
-        elif 'drama' in genre_lower:
-            scores = [5, 6, 7, 8, 7]
-        elif 'comedy' in genre_lower:
-            scores = [6, 6, 5, 7, 8]
-        elif 'horror' in genre_lower:
-            scores = [7, 6, 5, 8, 9]
-        else:
-            scores = [6, 7, 7, 8, 9]
+        genre_tokens = set(GENRE_SPLIT_RE.split(str(genres).lower()))
+        scores = next((curve for genre, curve in MOCK_GENRE_SCORES.items() if genre in genre_tokens), MOCK_DEFAULT_SCORES)
         
         return f"""Beginning: {scores[0]}/10
 Description: The opening establishes the setting and introduces key characters
@@ -390,8 +1000,6 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
         Returns:
             Structured dictionary with intensity ratings and descriptions
         """
-        import re
-        
         if not response_text or not isinstance(response_text, str):
             # Return default structure instead of raising error
             return {
@@ -409,7 +1017,7 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
             }
         
         result = {
-            'full_analysis': response_text,
+            'full_analysis': response_text.strip(),
             'intensity_ratings': {
                 'beginning': {'score': 0, 'description': ''},
                 'first_half': {'score': 0, 'description': ''},
@@ -423,48 +1031,23 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
         }
         
         try:
-            # Extract intensity scores - simple pattern matching
-            segments = {
-                'beginning': r'beginning[:\-\s]+(\d+)/10',
-                'first_half': r'first\s+half[:\-\s]+(\d+)/10',
-                'interval': r'interval[:\-\s]+(\d+)/10',
-                'second_half': r'second\s+half[:\-\s]+(\d+)/10',
-                'climax': r'climax[:\-\s]+(\d+)/10'
-            }
+            # Extract intensity scores - first "<segment>: N/10" occurrence wins
+            scored = set()
+            for match in SEGMENT_SCORE_RE.finditer(response_text):
+                segment = WS_RE.sub('_', match.group(1).lower())
+                if segment not in scored:
+                    scored.add(segment)
+                    result['intensity_ratings'][segment]['score'] = int(match.group(2))
             
-            for segment, pattern in segments.items():
-                match = re.search(pattern, response_text, re.IGNORECASE)
-                if match:
-                    result['intensity_ratings'][segment]['score'] = int(match.group(1))
+            # Extract descriptions - the line right after each score line
+            for match in SEGMENT_DESCRIPTION_RE.finditer(response_text):
+                segment = WS_RE.sub('_', match.group(1).lower())
+                result['intensity_ratings'][segment]['description'] = match.group(2).strip()
             
-            # Extract descriptions - simple line-based parsing
-            segment_map = {'beginning': 'beginning', 'first half': 'first_half', 'interval': 'interval', 
-                           'second half': 'second_half', 'climax': 'climax'}
-            current_seg = None
-            
-            for line in response_text.split('\n'):
-                line_clean = line.strip()
-                line_lower = line_clean.lower()
-                
-                # Check for segment headers
-                for key, seg_name in segment_map.items():
-                    if key in line_lower and ('/10' in line_lower or 'description' in line_lower):
-                        current_seg = seg_name
-                        break
-                
-                # Extract description
-                if current_seg and 'description:' in line_lower:
-                    desc = line_clean.split(':', 1)[1].strip() if ':' in line_clean else ''
-                    result['intensity_ratings'][current_seg]['description'] = desc
-                    current_seg = None
-                
-                # Extract other sections
-                if 'overall' in line_lower and 'arc' in line_lower:
-                    result['overall_arc'] = line_clean.split(':', 1)[1].strip() if ':' in line_clean else ''
-                elif 'peak moment' in line_lower:
-                    result['peak_moments'] = line_clean.split(':', 1)[1].strip() if ':' in line_clean else ''
-                elif 'pacing' in line_lower:
-                    result['pacing_assessment'] = line_clean.split(':', 1)[1].strip() if ':' in line_clean else ''
+            # Extract summary sections (last occurrence wins)
+            for match in SUMMARY_LINE_RE.finditer(response_text):
+                field = SUMMARY_FIELDS[match.group(1).split()[0].lower()]
+                result[field] = match.group(2).strip()
         
         except Exception as e:
             print(f"Warning: Error during parsing: {e}")
@@ -472,10 +1055,36 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
         
         return result
     
+    def fetch_reviews(self, movies: List[Dict[str, Any]], max_workers: int = 4) -> List[list]:
+        """
+        Fetch IMDb reviews for several movies concurrently
+        Scraping waits almost entirely on the network; each worker takes its own
+        browser from the driver pool (CHROME_POOL_SIZE) and writes its own temp file
+        
+        Args:
+            movies: List of movie dictionaries with imdb_id (same shape as _fetch_movie_reviews)
+            max_workers: Maximum number of movies scraped at once
+        
+        Returns:
+            List of review text lists, in the same order as movies
+        """
+        results: List[list] = [[] for _ in movies]
+        if not movies:
+            return results
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch_movie_reviews, movie): i for i, movie in enumerate(movies)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"⚠ Error fetching reviews for '{movies[i].get('title', '')}': {e}", file=sys.stderr)
+        return results
+    
     def _fetch_movie_reviews(self, movie: Dict[str, Any]) -> list:
         """
         Fetch IMDb reviews for the movie and save to a temporary file
-        Only works if movie has an imdb_id field
+        Needs an imdb_id field, or a title the TMDB dataset can resolve to one
         
         Args:
             movie: Dictionary containing movie information with imdb_id
@@ -490,25 +1099,39 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
             print("No title provided for review fetching", file=sys.stderr)
             return []
         
+        if not imdb_id:
+            try:
+                imdb_id = resolve_imdb_id(title)
+            except Exception as e:
+                print(f"⚠ Could not look up IMDb ID for '{title}': {e}", file=sys.stderr)
+        
         if not imdb_id:
             print(f"No IMDb ID available for '{title}', cannot fetch reviews", file=sys.stderr)
             return []
         
         # First, try to read from existing temp file
         temp_dir = Path(__file__).parent.parent / "temp"
-        safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in title)
+        safe_title = _safe_filename(title)
         safe_title = '_'.join(safe_title.split()).lower()
         temp_file = temp_dir / f"{safe_title}_reviews.json"
         
         # Check if temp file already exists
-        if temp_file.exists():
+        try:
+            mtime_ns = temp_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            # Skip re-parsing a temp file that hasn't changed since we last read it
+            cached = self._reviews_mem_cache.get(imdb_id)
+            if cached is not None and cached[0] == mtime_ns:
+                return list(cached[1])
             try:
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'reviews' in data:
-                        reviews = [r['text'] for r in data['reviews']]
-                        print(f"✓ Loaded {len(reviews)} reviews from cache: {temp_file}", file=sys.stderr)
-                        return reviews
+                data = _read_json(temp_file)
+                if 'reviews' in data:
+                    reviews = [r['text'] for r in data['reviews']]
+                    self._reviews_mem_cache[imdb_id] = (mtime_ns, reviews)
+                    print(f"✓ Loaded {len(reviews)} reviews from cache: {temp_file}", file=sys.stderr)
+                    return list(reviews)
             except Exception as e:
                 print(f"⚠ Could not read cached reviews: {e}", file=sys.stderr)
         
@@ -529,6 +1152,152 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
             print(f"⚠ Error fetching reviews for '{title}': {e}", file=sys.stderr)
             return []
     
+    def _fetch_imdb_reviews_graphql(self, imdb_id: str, max_reviews: int) -> list:
+        """Fetch up to max_reviews non-spoiler review texts from IMDb's GraphQL API (no browser)"""
+        collected_reviews = []
+        seen_texts = set()
+        cursor = None
+        try:
+            while len(collected_reviews) < max_reviews:
+                response = self._get_session().post(
+                    IMDB_GRAPHQL_URL,
+                    headers={
+                        "Content-Type": "application/json",
+                        "x-imdb-user-language": "en-US",
+                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    },
+                    json={"query": IMDB_REVIEWS_QUERY, "variables": {"id": imdb_id, "first": 25, "after": cursor}},
+                    timeout=(5, 10)
+                )
+                if response.status_code != 200:
+                    print(f"DEBUG: IMDb GraphQL request failed: {response.status_code}", file=sys.stderr)
+                    break
+                
+                reviews = ((response.json().get('data') or {}).get('title') or {}).get('reviews') or {}
+                for edge in reviews.get('edges') or []:
+                    node = edge.get('node') or {}
+                    if node.get('spoiler'):
+                        continue
+                    review_text = (((node.get('text') or {}).get('originalText') or {}).get('plainText') or '').strip()
+                    if review_text and review_text not in seen_texts and len(review_text) > 50:
+                        seen_texts.add(review_text)
+                        collected_reviews.append(review_text)
+                        if len(collected_reviews) >= max_reviews:
+                            break
+                
+                page_info = reviews.get('pageInfo') or {}
+                cursor = page_info.get('endCursor')
+                if not page_info.get('hasNextPage') or not cursor:
+                    break
+        except Exception as e:
+            print(f"DEBUG: IMDb GraphQL fetch failed: {e}", file=sys.stderr)
+        
+        print(f"DEBUG: GraphQL returned {len(collected_reviews)} reviews for {imdb_id}", file=sys.stderr)
+        return collected_reviews
+    
+    def _collect_imdb_reviews(self, driver, url: str, max_reviews: int,
+                              on_review: Optional[Callable[[int, str], None]] = None,
+                              resume_from: Optional[List[str]] = None) -> list:
+        """
+        Load an IMDb reviews page in the given driver and collect up to max_reviews non-spoiler reviews
+        
+        on_review, if given, is called with (review_number, text) as each new review is collected.
+        resume_from seeds the results (and duplicate check) with reviews kept from an interrupted scrape.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        wait = WebDriverWait(driver, 15)
+        # A page that stops growing after "load more" is done; don't spend the full page wait on each click
+        load_more_wait = WebDriverWait(driver, LOAD_MORE_TIMEOUT)
+        print(f"DEBUG: Navigating to {url}", file=sys.stderr)
+        driver.get(url)
+        
+        collected_reviews = list(resume_from or [])
+        seen_texts = set(collected_reviews)
+        
+        # Wait for the first reviews to render instead of sleeping a fixed time
+        print(f"DEBUG: Waiting for review elements...", file=sys.stderr)
+        try:
+            wait.until(lambda d: d.find_elements(By.CSS_SELECTOR, REVIEW_ITEMS_CSS))
+            print(f"DEBUG: Review elements found", file=sys.stderr)
+        except TimeoutException:
+            print(f"DEBUG: Timeout waiting for reviews", file=sys.stderr)
+            return collected_reviews
+        try:
+            driver.execute_script(REVIEW_COUNT_OBSERVER_JS, REVIEW_ITEMS_CSS)
+            review_count = lambda d: d.execute_script("return window.__reviewCount || 0;")
+        except Exception as e:
+            print(f"DEBUG: Could not install review observer: {e}", file=sys.stderr)
+            review_count = lambda d: len(d.find_elements(By.CSS_SELECTOR, REVIEW_ITEMS_CSS))
+        
+        attempts = 0
+        scanned = 0
+        while len(collected_reviews) < max_reviews and attempts < 8:
+            attempts += 1
+            print(f"DEBUG: Scraping attempt {attempts}, collected so far: {len(collected_reviews)}", file=sys.stderr)
+            
+            # Texts of the articles added since the last pass, in one script call
+            try:
+                batch = driver.execute_script(REVIEW_TEXTS_JS, scanned) or {}
+                review_texts = batch.get('texts') or []
+                scanned = batch.get('scanned', scanned)
+            except Exception as e:
+                print(f"DEBUG: Failed to extract reviews: {e}", file=sys.stderr)
+                review_texts = []
+            
+            print(f"DEBUG: Found {len(review_texts)} review texts", file=sys.stderr)
+            
+            for review_text in review_texts:
+                if len(collected_reviews) >= max_reviews:
+                    break
+                if review_text not in seen_texts and len(review_text) > 50:
+                    seen_texts.add(review_text)
+                    collected_reviews.append(review_text)
+                    if on_review is not None:
+                        on_review(len(collected_reviews), review_text)
+            print(f"DEBUG: Collected {len(collected_reviews)} reviews", file=sys.stderr)
+            
+            # Try to load more
+            if len(collected_reviews) < max_reviews:
+                try:
+                    prev_count = driver.execute_script(LOAD_MORE_JS, REVIEW_ITEMS_CSS)
+                except Exception as e:
+                    print(f"DEBUG: Failed to click load more: {e}", file=sys.stderr)
+                    break
+                if prev_count is None or prev_count < 0:
+                    print(f"DEBUG: No more load button", file=sys.stderr)
+                    break
+                print(f"DEBUG: Clicked load more button", file=sys.stderr)
+                # Continue as soon as the next batch has rendered
+                try:
+                    load_more_wait.until(lambda d: review_count(d) > prev_count)
+                except TimeoutException:
+                    print("DEBUG: No new reviews after load more", file=sys.stderr)
+                    break
+        
+        return collected_reviews
+
+    @staticmethod
+    def _read_partial_reviews(partial_file: Path) -> List[str]:
+        """Review texts saved by an interrupted scrape (skipping a torn last line), or [] if there are none"""
+        reviews = []
+        seen = set()
+        try:
+            with open(partial_file, 'rb') as f:
+                for line in f:
+                    try:
+                        text = (orjson.loads(line) if orjson is not None else json.loads(line)).get('text')
+                    except (ValueError, AttributeError):
+                        continue
+                    if text and text not in seen:
+                        seen.add(text)
+                        reviews.append(text)
+        except OSError:
+            pass
+        return reviews
+
     def _scrape_imdb_reviews_by_id(self, imdb_id: str, title: str, output_file: Path, min_reviews: int = 15, max_reviews: int = 35) -> list:
         """
         Scrape IMDb reviews directly using IMDb ID
@@ -546,111 +1315,46 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
         try:
             print(f"DEBUG: Starting scrape for {imdb_id}", file=sys.stderr)
             
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.common.exceptions import TimeoutException, NoSuchElementException
-            import time
-            
-            print(f"DEBUG: Selenium imports successful", file=sys.stderr)
-            
-            # Setup Chrome in headless mode
-            options = webdriver.ChromeOptions()
-            options.page_load_strategy = "eager"
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            print(f"DEBUG: Starting Chrome driver...", file=sys.stderr)
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-            driver.set_page_load_timeout(45)
-            wait = WebDriverWait(driver, 15)
-            
             url = f"https://www.imdb.com/title/{imdb_id}/reviews/"
-            print(f"DEBUG: Navigating to {url}", file=sys.stderr)
-            driver.get(url)
-            time.sleep(3)
+            partial_file = output_file.with_name(output_file.name + '.partial.jsonl')
             
+            # Plain JSON request first; IMDB_REVIEWS_SELENIUM=1 forces the browser scraper
             collected_reviews = []
-            seen_texts = set()
+            if os.getenv('IMDB_REVIEWS_SELENIUM') != '1':
+                collected_reviews = self._fetch_imdb_reviews_graphql(imdb_id, max_reviews)
             
-            # Try to load reviews
-            print(f"DEBUG: Waiting for review elements...", file=sys.stderr)
-            try:
-                wait.until(lambda d: d.find_elements(By.CSS_SELECTOR, "article[class*='user-review-item'], div.review-container"))
-                print(f"DEBUG: Review elements found", file=sys.stderr)
-            except TimeoutException:
-                print(f"DEBUG: Timeout waiting for reviews", file=sys.stderr)
-                driver.quit()
-                return []
-            
-            attempts = 0
-            while len(collected_reviews) < max_reviews and attempts < 8:
-                attempts += 1
-                print(f"DEBUG: Scraping attempt {attempts}, collected so far: {len(collected_reviews)}", file=sys.stderr)
-                
-                review_articles = driver.find_elements(By.CSS_SELECTOR, "article[class*='user-review-item']")
-                if not review_articles:
-                    review_articles = driver.find_elements(By.CSS_SELECTOR, "div.review-container")
-                
-                print(f"DEBUG: Found {len(review_articles)} review elements", file=sys.stderr)
-                
-                for article in review_articles:
-                    if len(collected_reviews) >= max_reviews:
-                        break
+            if not collected_reviews:
+                # Reviews go to a partial JSONL as they arrive so a crashed or interrupted scrape
+                # keeps what it collected; the next scrape resumes from it, and it is removed
+                # once the JSON is written
+                resumed = self._read_partial_reviews(partial_file)
+                if resumed:
+                    print(f"DEBUG: Resuming with {len(resumed)} reviews from {partial_file}", file=sys.stderr)
+                if len(resumed) >= max_reviews:
+                    collected_reviews = resumed[:max_reviews]
+                else:
+                    partial = None
                     
-                    try:
-                        # Skip spoilers
-                        article.find_element(By.CSS_SELECTOR, 'div[data-testid="review-spoiler-content"]')
-                        continue
-                    except:
-                        pass
+                    def on_review(n: int, text: str):
+                        nonlocal partial
+                        if partial is None:
+                            output_file.parent.mkdir(parents=True, exist_ok=True)
+                            partial = open(partial_file, 'ab')
+                        partial.write(_dump_json({"n": n, "text": text}) + b'\n')
+                        partial.flush()
                     
                     try:
-                        review_text = None
-                        try:
-                            review_text = article.find_element(By.CSS_SELECTOR, "div.ipc-html-content-inner-div").text.strip()
-                        except NoSuchElementException:
-                            try:
-                                review_text = article.find_element(By.CSS_SELECTOR, "div.text.show-more__control").text.strip()
-                            except NoSuchElementException:
-                                try:
-                                    review_text = article.find_element(By.CSS_SELECTOR, "div.content").text.strip()
-                                except:
-                                    pass
-                        
-                        if review_text and review_text not in seen_texts and len(review_text) > 50:
-                            seen_texts.add(review_text)
-                            collected_reviews.append(review_text)
-                            print(f"DEBUG: Collected review #{len(collected_reviews)}", file=sys.stderr)
-                    except Exception as e:
-                        print(f"DEBUG: Failed to extract review: {e}", file=sys.stderr)
-                        continue
-                
-                # Try to load more
-                if len(collected_reviews) < max_reviews:
-                    try:
-                        load_more = driver.find_element(By.CSS_SELECTOR, "button.ipc-see-more__button:not([aria-disabled='true'])")
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", load_more)
-                        time.sleep(0.5)
-                        driver.execute_script("arguments[0].click();", load_more)
-                        print(f"DEBUG: Clicked load more button", file=sys.stderr)
-                        time.sleep(2)
-                    except Exception as e:
-                        print(f"DEBUG: No more load button: {e}", file=sys.stderr)
-                        break
-            
-            driver.quit()
+                        # Browsers are pooled across scrapes (and analyzers) instead of started per movie
+                        with _DRIVER_POOL.acquire() as driver:
+                            collected_reviews = self._collect_imdb_reviews(driver, url, max_reviews, on_review, resumed)
+                    finally:
+                        if partial is not None:
+                            partial.close()
             print(f"DEBUG: Scraping complete, total reviews: {len(collected_reviews)}", file=sys.stderr)
             
             if len(collected_reviews) == 0:
                 print(f"WARNING: No reviews collected from {url}", file=sys.stderr)
+                partial_file.unlink(missing_ok=True)
                 return []
             
             # Save to JSON
@@ -662,8 +1366,8 @@ IMPORTANT: Rate based on {title}'s actual story and audience reactions in review
             }
             
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(reviews_data, f, indent=2, ensure_ascii=False)
+            output_file.write_bytes(_dump_json(reviews_data, indent=True))
+            partial_file.unlink(missing_ok=True)
             
             return collected_reviews
             